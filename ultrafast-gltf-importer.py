@@ -6,13 +6,34 @@ then bulk-create Blender objects with materials.
 
 import bpy
 import json
-import struct
 import os
-import pickle
+import sys
+import mmap
+import numpy as np
 from pathlib import Path
-from mathutils import Vector, Matrix, Quaternion
+from concurrent.futures import ProcessPoolExecutor
+from mathutils import Matrix
 import time
 
+# msgspec and orjson both parse JSON several times faster than stdlib;
+# prefer whichever is installed, fall back to json on a stock Blender Python
+try:
+    import msgspec
+    _decode_json = msgspec.json.decode
+except ImportError:
+    try:
+        import orjson
+        _decode_json = orjson.loads
+    except ImportError:
+        _decode_json = json.loads
+
+# numba is optional: when present, the dequantization pass for quantized
+# meshes runs as one fused LLVM-vectorized loop instead of numpy temporaries
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # ============================================
 # CONFIGURATION
 # ============================================
@@ -24,7 +45,7 @@ GLTF_FOLDER = r"C:\Users\...\project-name\modelLib"
 TEXTURE_FOLDER = r"C:\Users\...\project-name\modelLib\texture"
 
 # 3. CACHE LOCATIONS (Delete these files to force a rebuild!)
-CACHE_FILE = r"C:\Users\...\project-name\cache\gltf_cache.pkl"
+CACHE_FILE = r"C:\Users\...\project-name\cache\gltf_cache.npz"
 PROGRESS_FILE = r"C:\Users\...\project-name\progress\import_progress.json"
 
 # Import options
@@ -35,13 +56,149 @@ IMPORT_TEXTURES = True
 # STEP 1: PREPROCESS (Builds the Cache)
 # ============================================
 
+# Texture lookup caches (module-level, so each worker process seeds its own).
+# _tex_folder_files is a one-time listdir of TEXTURE_FOLDER; a set lookup
+# replaces up to 3 exists() syscalls per primitive. Names are casefolded so
+# membership stays case-insensitive like exists() was on Windows.
+_tex_folder_files = None
+_resolved_textures = {}
+
+def resolve_texture_path(uri, gltf_dir):
+    global _tex_folder_files
+    key = (uri, gltf_dir)
+    if key in _resolved_textures:
+        return _resolved_textures[key]
+
+    tex_folder = Path(TEXTURE_FOLDER)
+    if _tex_folder_files is None:
+        try:
+            _tex_folder_files = {n.casefold() for n in os.listdir(tex_folder)}
+        except OSError:
+            _tex_folder_files = set()
+
+    filename = Path(uri).name
+    texture_path = None
+    if filename == uri:
+        # Flat name: the listdir set answers both texture-folder checks.
+        # The returned path keeps the URI's own casing (Windows doesn't care).
+        if uri.casefold() in _tex_folder_files:
+            texture_path = str(tex_folder / uri)
+    else:
+        # URI has subfolders: check the full relative path, then just the name
+        check_sub = tex_folder / uri
+        if check_sub.exists():
+            texture_path = str(check_sub)
+        elif filename.casefold() in _tex_folder_files:
+            texture_path = str(tex_folder / filename)
+
+    if texture_path is None:
+        # Fall back to the gltf's own folder
+        check_local = Path(gltf_dir) / uri
+        if check_local.exists():
+            texture_path = str(check_local)
+
+    if texture_path is not None:
+        # Intern so identical paths share one string: smaller cache on disk
+        # and pointer-fast materials_cache lookups at import time
+        texture_path = sys.intern(texture_path)
+    _resolved_textures[key] = texture_path
+    return texture_path
+
+# GLTF componentType -> numpy dtype (integer types appear on
+# KHR_mesh_quantization meshes)
+_COMPONENT_DTYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _dequant_kernel(src, out, scale, do_clamp):
+        # No infinities in here: fastmath assumes finite operands, so the
+        # no-clamp case is a flag rather than a compare against -inf
+        for i in range(src.size):
+            v = src[i] * scale
+            if do_clamp and v < -1.0:
+                v = -1.0
+            out[i] = v
+
+def _dequantize(arr, normalized):
+    # Integer attribute -> float32 per the GLTF normalized-accessor rules:
+    # unsigned c/maxint, signed max(c/maxint, -1); raw cast when not normalized
+    info = np.iinfo(arr.dtype)
+    scale = 1.0 / info.max if normalized else 1.0
+    do_clamp = normalized and info.min < 0
+    out = np.empty(arr.shape, np.float32)
+    if njit is not None:
+        _dequant_kernel(arr.ravel(), out.ravel(), scale, do_clamp)
+    else:
+        np.multiply(arr, scale, out=out)
+        if do_clamp:
+            np.maximum(out, -1.0, out=out)
+    return out
+
+def read_attribute(bin_data, offset, stride, count, comps, ctype, normalized):
+    # Decode one accessor's worth of vec2/vec3 data to a float32 (count, comps)
+    # array: single frombuffer for tight packing, strided view + compaction for
+    # interleaved buffers, then dequantize if the components are integers
+    dtype = np.dtype(_COMPONENT_DTYPES[ctype])
+    itemsize = dtype.itemsize * comps
+    if stride == itemsize:
+        arr = np.frombuffer(bin_data, dtype, count * comps, offset).reshape(-1, comps)
+    else:
+        # GLTF only guarantees bytes up to the end of the last element, not a
+        # full stride past it, so don't request count*stride
+        nbytes = (count - 1) * stride + itemsize
+        base = np.frombuffer(bin_data, np.uint8, nbytes, offset)
+        arr = np.ascontiguousarray(
+            np.lib.stride_tricks.as_strided(
+                base.view(dtype), shape=(count, comps), strides=(stride, dtype.itemsize)))
+    if ctype != 5126:
+        arr = _dequantize(arr, normalized)
+    return arr
+
+def compose_matrix_np(t):
+    # Compose a GLTF node transform into a row-major 4x4 float32 matrix,
+    # done once at preprocess time instead of per mesh at import time
+    if 'matrix' in t:
+        # Transpose because GLTF is column-major
+        return np.array(t['matrix'], np.float32).reshape(4, 4).T.copy()
+
+    mat = np.identity(4, np.float32)
+    if 'translation' in t:
+        trans = np.identity(4, np.float32)
+        trans[:3, 3] = t['translation']
+        mat = trans @ mat
+    if 'rotation' in t:
+        # GLTF quaternion is (x, y, z, w)
+        x, y, z, w = t['rotation']
+        n = (x*x + y*y + z*z + w*w) ** 0.5
+        if n > 0.0:
+            x, y, z, w = x/n, y/n, z/n, w/n
+        rot = np.identity(4, np.float32)
+        rot[:3, :3] = [
+            [1 - 2*(y*y + z*z), 2*(x*y - z*w), 2*(x*z + y*w)],
+            [2*(x*y + z*w), 1 - 2*(x*x + z*z), 2*(y*z - x*w)],
+            [2*(x*z - y*w), 2*(y*z + x*w), 1 - 2*(x*x + y*y)],
+        ]
+        mat = rot @ mat
+    if 'scale' in t:
+        scale = np.identity(4, np.float32)
+        scale[0, 0], scale[1, 1], scale[2, 2] = t['scale']
+        mat = scale @ mat
+    return mat
+
 def preprocess_gltf_file(gltf_path):
     gltf_path = Path(gltf_path)
-    tex_folder = Path(TEXTURE_FOLDER)
-    
+
     try:
-        with open(gltf_path, 'r') as f:
-            gltf_data = json.load(f)
+        with open(gltf_path, 'rb') as f:
+            raw = f.read()
+        gltf_data = _decode_json(raw)
         
         # Load binary data (.bin)
         bin_data = None
@@ -51,8 +208,11 @@ def preprocess_gltf_file(gltf_path):
                     # Usually .bin is next to .gltf
                     bin_path = gltf_path.parent / buffer['uri']
                     if bin_path.exists():
+                        # Map instead of read: no full-blob copy, and np.frombuffer
+                        # reads straight out of the page cache. The map stays alive
+                        # as long as any array still views it.
                         with open(bin_path, 'rb') as f:
-                            bin_data = f.read()
+                            bin_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
                         break
         
         if not bin_data:
@@ -63,77 +223,79 @@ def preprocess_gltf_file(gltf_path):
             'meshes': []
         }
         
-        # --- 1. Get Node Transforms ---
-        node_transforms = {}
+        # --- 1. Get Node Transforms (composed to matrices up front) ---
+        node_matrices = {}
         if 'nodes' in gltf_data:
             for node in gltf_data['nodes']:
                 if 'mesh' in node:
-                    mesh_idx = node['mesh']
-                    transform = {}
-                    if 'matrix' in node: transform['matrix'] = node['matrix']
-                    if 'translation' in node: transform['translation'] = node['translation']
-                    if 'rotation' in node: transform['rotation'] = node['rotation']
-                    if 'scale' in node: transform['scale'] = node['scale']
-                    node_transforms[mesh_idx] = transform
+                    transform = {k: node[k] for k in ('matrix', 'translation', 'rotation', 'scale')
+                                 if k in node}
+                    if transform:
+                        node_matrices[node['mesh']] = compose_matrix_np(transform)
 
         if 'meshes' not in gltf_data: return None
 
+        # Per-file memo of decoded accessors: optimized exports (gltfpack etc.)
+        # often reference the same accessor from many primitives, so decode
+        # each one only once. UVs are cached post-flip, indices stay flat.
+        decoded = {}
+
+        def decode_vec_accessor(acc_idx, comps):
+            acc = gltf_data['accessors'][acc_idx]
+            view = gltf_data['bufferViews'][acc['bufferView']]
+            offset = view.get('byteOffset', 0) + acc.get('byteOffset', 0)
+            ctype = acc['componentType']
+            stride = view.get('byteStride', np.dtype(_COMPONENT_DTYPES[ctype]).itemsize * comps)
+            return read_attribute(bin_data, offset, stride, acc['count'], comps,
+                                  ctype, acc.get('normalized', False))
+
         # --- 2. Process Meshes ---
         for mesh_idx, mesh in enumerate(gltf_data['meshes']):
             for primitive in mesh['primitives']:
                 if 'POSITION' not in primitive['attributes']: continue
-                
+
                 # A. Extract Positions
-                pos_acc = gltf_data['accessors'][primitive['attributes']['POSITION']]
-                pos_view = gltf_data['bufferViews'][pos_acc['bufferView']]
-                pos_offset = pos_view.get('byteOffset', 0) + pos_acc.get('byteOffset', 0)
-                stride = pos_view.get('byteStride', 12)
-                count = pos_acc['count']
-                
-                positions = []
-                for i in range(count):
-                    off = pos_offset + (i * stride)
-                    x, y, z = struct.unpack('<fff', bin_data[off:off+12])
-                    positions.append((x, y, z))
+                pos_idx = primitive['attributes']['POSITION']
+                if ('pos', pos_idx) not in decoded:
+                    decoded[('pos', pos_idx)] = decode_vec_accessor(pos_idx, 3)
+                positions = decoded[('pos', pos_idx)]
 
                 # B. Extract UVs (TEXCOORD_0)
-                uvs = []
+                uvs = None
                 if 'TEXCOORD_0' in primitive['attributes']:
-                    uv_acc = gltf_data['accessors'][primitive['attributes']['TEXCOORD_0']]
-                    uv_view = gltf_data['bufferViews'][uv_acc['bufferView']]
-                    uv_offset_base = uv_view.get('byteOffset', 0) + uv_acc.get('byteOffset', 0)
-                    uv_stride = uv_view.get('byteStride', 8)
-                    
-                    for i in range(count):
-                        off = uv_offset_base + (i * uv_stride)
-                        u, v = struct.unpack('<ff', bin_data[off:off+8])
-                        uvs.append((u, v))
-
-                # C. Extract Indices (Faces)
-                indices = []
+                    uv_idx = primitive['attributes']['TEXCOORD_0']
+                    if ('uv', uv_idx) not in decoded:
+                        uvs = decode_vec_accessor(uv_idx, 2)
+                        if not uvs.flags.writeable:
+                            uvs = uvs.copy()
+                        # Flip V for Blender once, in a single vectorized pass
+                        uvs[:, 1] = 1.0 - uvs[:, 1]
+                        decoded[('uv', uv_idx)] = uvs
+                    uvs = decoded[('uv', uv_idx)]
+
+                # C. Extract Indices. Kept flat: Blender's loops want exactly
+                # this array, so there's no point reshaping into triangles.
+                indices = None
                 if 'indices' in primitive:
-                    idx_acc = gltf_data['accessors'][primitive['indices']]
-                    idx_view = gltf_data['bufferViews'][idx_acc['bufferView']]
-                    idx_offset = idx_view.get('byteOffset', 0) + idx_acc.get('byteOffset', 0)
-                    idx_count = idx_acc['count']
-                    ctype = idx_acc['componentType']
-                    
-                    if ctype == 5123: # USHORT
-                        for i in range(idx_count):
-                            off = idx_offset + (i * 2)
-                            indices.append(struct.unpack('<H', bin_data[off:off+2])[0])
-                    elif ctype == 5125: # UINT
-                        for i in range(idx_count):
-                            off = idx_offset + (i * 4)
-                            indices.append(struct.unpack('<I', bin_data[off:off+4])[0])
-
-                faces = []
-                if indices:
-                    for i in range(0, len(indices), 3):
-                        faces.append((indices[i], indices[i+1], indices[i+2]))
-                else:
-                    for i in range(0, len(positions), 3):
-                        faces.append((i, i+1, i+2))
+                    idx_idx = primitive['indices']
+                    if ('idx', idx_idx) in decoded:
+                        indices = decoded[('idx', idx_idx)]
+                    else:
+                        idx_acc = gltf_data['accessors'][idx_idx]
+                        idx_view = gltf_data['bufferViews'][idx_acc['bufferView']]
+                        idx_offset = idx_view.get('byteOffset', 0) + idx_acc.get('byteOffset', 0)
+                        idx_count = idx_acc['count']
+                        ctype = idx_acc['componentType']
+
+                        # UBYTE / USHORT / UINT (uint8 shows up on quantized meshes)
+                        idx_dtype = {5121: np.uint8, 5123: np.uint16, 5125: np.uint32}.get(ctype)
+                        if idx_dtype is not None:
+                            indices = np.frombuffer(bin_data, idx_dtype, idx_count, idx_offset)
+                            decoded[('idx', idx_idx)] = indices
+
+                if indices is None:
+                    # Non-indexed geometry: sequential triangles
+                    indices = np.arange(len(positions), dtype=np.uint32)
 
                 # D. Find Texture Path
                 texture_path = None
@@ -151,32 +313,14 @@ def preprocess_gltf_file(gltf_path):
                                 images = gltf_data.get('images', [])
                                 if img_idx < len(images):
                                     uri = images[img_idx]['uri']
-                                    
-                                    # LOGIC: Check where the file actually exists
-                                    
-                                    # 1. Check same folder as GLTF
-                                    check_local = gltf_path.parent / uri
-                                    
-                                    # 2. Check the specific texture folder
-                                    check_tex_folder = tex_folder / uri
-                                    
-                                    # 3. Check just the filename in texture folder (ignore subpaths in URI)
-                                    filename = Path(uri).name
-                                    check_flat = tex_folder / filename
-                                    
-                                    if check_tex_folder.exists():
-                                        texture_path = str(check_tex_folder)
-                                    elif check_flat.exists():
-                                        texture_path = str(check_flat)
-                                    elif check_local.exists():
-                                        texture_path = str(check_local)
+                                    texture_path = resolve_texture_path(uri, str(gltf_path.parent))
 
                 mesh_cache['meshes'].append({
                     'verts': positions,
-                    'faces': faces,
+                    'indices': indices,
                     'uvs': uvs,
                     'texture_path': texture_path,
-                    'transform': node_transforms.get(mesh_idx, {})
+                    'matrix_world': node_matrices.get(mesh_idx)
                 })
         
         return mesh_cache
@@ -185,23 +329,98 @@ def preprocess_gltf_file(gltf_path):
         print(f"Error preprocessing {gltf_path.name}: {e}")
         return None
 
+def save_cache(cache_data, cache_file):
+    # npz layout: one entry per ndarray plus a '_meta' JSON blob holding
+    # everything that isn't vertex data. Avoids pickling millions of objects.
+    arrays = {}
+    meta = []
+    for i, item in enumerate(cache_data):
+        entry = {'name': item['name'], 'meshes': []}
+        for j, m in enumerate(item['meshes']):
+            key = f"m{i}_{j}"
+            arrays[key + '_verts'] = m['verts']
+            arrays[key + '_indices'] = m['indices']
+            if m['uvs'] is not None:
+                arrays[key + '_uvs'] = m['uvs']
+            if m['matrix_world'] is not None:
+                arrays[key + '_mat'] = m['matrix_world']
+            entry['meshes'].append({
+                'key': key,
+                'has_uvs': m['uvs'] is not None,
+                'has_matrix': m['matrix_world'] is not None,
+                'texture_path': m['texture_path'],
+            })
+        meta.append(entry)
+    arrays['_meta'] = np.frombuffer(json.dumps(meta).encode('utf-8'), np.uint8)
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    with open(cache_file, 'wb') as f:
+        np.savez(f, **arrays)
+
+def load_cache(cache_file):
+    cache_data = []
+    with np.load(cache_file) as z:
+        meta = json.loads(z['_meta'].tobytes())
+        for entry in meta:
+            item = {'name': entry['name'], 'meshes': []}
+            for m in entry['meshes']:
+                key = m['key']
+                item['meshes'].append({
+                    'verts': z[key + '_verts'],
+                    'indices': z[key + '_indices'],
+                    'uvs': z[key + '_uvs'] if m['has_uvs'] else None,
+                    'texture_path': m['texture_path'],
+                    'matrix_world': z[key + '_mat'] if m['has_matrix'] else None,
+                })
+            cache_data.append(item)
+    return cache_data
+
+def list_gltf_files(gltf_folder):
+    # scandir is much cheaper than Path.glob: no fnmatch, no Path objects,
+    # no extra stat per entry. lower() keeps the match case-insensitive
+    # like glob was on Windows (.GLTF files are valid too).
+    with os.scandir(gltf_folder) as it:
+        return sorted(e.path for e in it if e.name.lower().endswith('.gltf'))
+
+def iter_preprocessed(gltf_files):
+    # Stream results out of the worker pool in order as they complete, so the
+    # consumer can start working before the last file is preprocessed.
+    # Yields None for files that failed or had no mesh data.
+    #
+    # The pool can fail outright inside Blender: spawned workers re-import
+    # this module, which needs bpy (and a module file at all -- the text
+    # editor has none). Fall back to serial preprocessing in that case,
+    # resuming after whatever the pool already delivered.
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for data in ex.map(preprocess_gltf_file, gltf_files, chunksize=8):
+                done += 1
+                yield data
+        return
+    except Exception as e:
+        # preprocess_gltf_file catches its own errors, so anything that
+        # reaches here is pool machinery (BrokenProcessPool, pickling, ...)
+        print(f"Process pool unavailable ({e}), preprocessing serially...")
+
+    for filepath in gltf_files[done:]:
+        yield preprocess_gltf_file(filepath)
+
 def build_cache(gltf_folder, cache_file):
     print("Building cache (including texture lookup)...")
     start_time = time.time()
-    
-    gltf_files = sorted([str(f) for f in Path(gltf_folder).glob("*.gltf")])
+
+    gltf_files = list_gltf_files(gltf_folder)
     cache_data = []
-    
-    for i, filepath in enumerate(gltf_files):
+
+    # Each file is independent and CPU-bound, so fan out across cores
+    for i, data in enumerate(iter_preprocessed(gltf_files)):
         if (i + 1) % 100 == 0: print(f"Preprocessing: {i+1}/{len(gltf_files)}")
-        data = preprocess_gltf_file(filepath)
         if data: cache_data.append(data)
-    
+
     # Save
-    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
-    with open(cache_file, 'wb') as f:
-        pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
-    
+    save_cache(cache_data, cache_file)
+
     print(f"Cache built in {time.time() - start_time:.2f}s")
     print(f"Saved to: {cache_file}")
 
@@ -209,137 +428,183 @@ def build_cache(gltf_folder, cache_file):
 # STEP 2: IMPORT
 # ============================================
 
-def get_or_create_material(texture_path, materials_cache):
+def preload_images(cache_data):
+    # Load each unique texture exactly once, before the import loop, so
+    # material creation is pure node wiring with no bpy.data.images scans
+    path_to_image = {}
+    unique_textures = {m['texture_path'] for item in cache_data
+                       for m in item['meshes'] if m['texture_path']}
+    for path in unique_textures:
+        try:
+            path_to_image[path] = bpy.data.images.load(path, check_existing=True)
+        except Exception as e:
+            print(f"Failed to load image {path}: {e}")
+    return path_to_image
+
+def get_or_create_material(texture_path, materials_cache, path_to_image):
     if not texture_path: return None
-    
+
     # Avoid reloading same texture twice
     if texture_path in materials_cache:
         return materials_cache[texture_path]
-    
+
+    img = path_to_image.get(texture_path)
+    if img is None:
+        # Streaming path loads lazily; warm path preloads, so this only
+        # fires for textures that failed to preload
+        try:
+            img = bpy.data.images.load(texture_path, check_existing=True)
+            path_to_image[texture_path] = img
+        except Exception as e:
+            print(f"Failed to load image {texture_path}: {e}")
+            return None
+
     try:
         filename = os.path.basename(texture_path)
         mat_name = f"Mat_{filename}"
-        
+
         mat = bpy.data.materials.new(name=mat_name)
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
         nodes.clear()
-        
+
         # Nodes
         output = nodes.new('ShaderNodeOutputMaterial')
         bsdf = nodes.new('ShaderNodeBsdfPrincipled')
         bsdf.inputs['Specular IOR Level'].default_value = 0.5
-        
+
         tex_node = nodes.new('ShaderNodeTexImage')
-        
-        # Load Image
-        img = bpy.data.images.get(filename)
-        if not img:
-            img = bpy.data.images.load(texture_path)
         tex_node.image = img
-        
+
         links.new(tex_node.outputs['Color'], bsdf.inputs['Base Color'])
         links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-        
+
         materials_cache[texture_path] = mat
         return mat
     except Exception as e:
         print(f"Failed to create material for {texture_path}: {e}")
         return None
 
-def parse_transform(t):
-    # Convert GLTF transform to Blender Matrix
-    if 'matrix' in t:
-        m = t['matrix']
-        # Transpose because GLTF is column-major
-        return Matrix([m[0:4], m[4:8], m[8:12], m[12:16]]).transposed()
-    
-    mat = Matrix.Identity(4)
-    if 'translation' in t:
-        mat = Matrix.Translation(Vector(t['translation'])) @ mat
-    if 'rotation' in t:
-        q = t['rotation']
-        # Blender Quaternion is (w, x, y, z), GLTF is (x, y, z, w)
-        mat = Quaternion((q[3], q[0], q[1], q[2])).to_matrix().to_4x4() @ mat
-    if 'scale' in t:
-        s = t['scale']
-        scale = Matrix.Identity(4)
-        scale[0][0], scale[1][1], scale[2][2] = s[0], s[1], s[2]
-        mat = scale @ mat
-    return mat
+def get_or_create_collection(col_name, collections_cache):
+    # 'name in bpy.data.collections' is a linear scan over an ID collection
+    # that keeps growing; the Python-side dict stays O(1)
+    col = collections_cache.get(col_name)
+    if col is None:
+        col = bpy.data.collections.new(col_name)
+        bpy.context.scene.collection.children.link(col)
+        collections_cache[col_name] = col
+    return col
+
+def import_mesh(col_name, mesh_name, mesh_info, materials_cache, path_to_image,
+                collections_cache):
+    col = get_or_create_collection(col_name, collections_cache)
+    bm = bpy.data.meshes.new(mesh_name)
+
+    verts = mesh_info['verts']
+    indices = mesh_info['indices']
+    num_loops = len(indices)
+    num_tris = num_loops // 3
+
+    # Allocate then blast flat arrays in via C (much faster than from_pydata).
+    # The cached index array is already the flat loop order Blender wants.
+    bm.vertices.add(len(verts))
+    bm.vertices.foreach_set("co", verts.ravel())
+    bm.loops.add(num_loops)
+    bm.polygons.add(num_tris)
+    # loop_total is derived from loop_start since Blender 3.6 (read-only)
+    bm.polygons.foreach_set("loop_start", np.arange(0, num_loops, 3, dtype=np.int32))
+    bm.loops.foreach_set("vertex_index", indices.astype(np.int32, copy=False))
+
+    # Apply UVs (V already flipped at preprocess time). Loop order is
+    # exactly the flat index array we just set, so gather the per-loop
+    # float2s with one fancy-index and write them in one call.
+    if mesh_info['uvs'] is not None:
+        uv_layer = bm.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", mesh_info['uvs'][indices].ravel())
+
+    bm.update(calc_edges=True)
+
+    # Create Object
+    obj = bpy.data.objects.new(mesh_name, bm)
+
+    # Apply Material
+    if IMPORT_TEXTURES and mesh_info['texture_path']:
+        mat = get_or_create_material(mesh_info['texture_path'], materials_cache, path_to_image)
+        if mat:
+            obj.data.materials.append(mat)
+
+    # Apply Transform (precomputed 4x4 from the cache)
+    if mesh_info['matrix_world'] is not None:
+        obj.matrix_world = Matrix(mesh_info['matrix_world'].tolist())
+
+    col.objects.link(obj)
 
 def bulk_import(cache_file):
     print("Loading objects into Blender...")
-    if not os.path.exists(cache_file):
-        print("Cache not found! Building now...")
-        build_cache(GLTF_FOLDER, CACHE_FILE)
-        
-    with open(cache_file, 'rb') as f:
-        cache_data = pickle.load(f)
-    
     materials_cache = {}
-    
+    # Seed from whatever already exists so re-runs reuse collections
+    collections_cache = {c.name: c for c in bpy.data.collections}
     start = time.time()
-    
-    for i, item in enumerate(cache_data):
-        # Create Collection
-        col_name = item['name']
-        if col_name not in bpy.data.collections:
-            col = bpy.data.collections.new(col_name)
-            bpy.context.scene.collection.children.link(col)
-        else:
-            col = bpy.data.collections[col_name]
-            
-        for m_idx, mesh_info in enumerate(item['meshes']):
-            # Create Mesh
-            mesh_name = f"{item['name']}_{m_idx}"
-            bm = bpy.data.meshes.new(mesh_name)
-            
-            verts = [Vector(v) for v in mesh_info['verts']]
-            bm.from_pydata(verts, [], mesh_info['faces'])
-            
-            # Apply UVs (Fastest method)
-            if mesh_info['uvs']:
-                uv_layer = bm.uv_layers.new(name="UVMap")
-                uvs = mesh_info['uvs']
-                # Map loops to vertex indices
-                for poly in bm.polygons:
-                    for loop_index in poly.loop_indices:
-                        vert_index = bm.loops[loop_index].vertex_index
-                        u, v = uvs[vert_index]
-                        # Flip V for Blender
-                        uv_layer.data[loop_index].uv = (u, 1.0 - v)
-            
-            bm.update()
-            
-            # Create Object
-            obj = bpy.data.objects.new(mesh_name, bm)
-            
-            # Apply Material
-            if IMPORT_TEXTURES and mesh_info['texture_path']:
-                mat = get_or_create_material(mesh_info['texture_path'], materials_cache)
-                if mat:
-                    obj.data.materials.append(mat)
-            
-            # Apply Transform
-            if mesh_info['transform']:
-                obj.matrix_world = parse_transform(mesh_info['transform'])
-                
-            col.objects.link(obj)
-            
-        if (i+1) % 50 == 0:
-            print(f"Imported {i+1} objects...")
+
+    cache_data = None
+    if os.path.exists(cache_file):
+        try:
+            cache_data = load_cache(cache_file)
+        except Exception as e:
+            # Old pickle caches (or a truncated write) aren't npz; treat
+            # them like a missing cache and rebuild instead of crashing
+            print(f"Cache unreadable ({e}), rebuilding...")
+
+    if cache_data is not None:
+        # Warm start: import from the cache, sorted by texture
+        path_to_image = preload_images(cache_data) if IMPORT_TEXTURES else {}
+
+        # Flatten and sort by texture: each material gets created exactly once,
+        # and all meshes sharing it are built back-to-back (better locality in
+        # bpy.data than hopping between materials). Stable sort keeps the
+        # original order within a group.
+        flat = [(m['texture_path'] or '', item['name'], m_idx, m)
+                for item in cache_data for m_idx, m in enumerate(item['meshes'])]
+        flat.sort(key=lambda e: e[0])
+
+        for i, (tex_path, col_name, m_idx, mesh_info) in enumerate(flat):
+            import_mesh(col_name, f"{col_name}_{m_idx}", mesh_info,
+                        materials_cache, path_to_image, collections_cache)
+            if (i+1) % 500 == 0:
+                print(f"Imported {i+1}/{len(flat)} meshes...")
+    else:
+        # Cold start: no pickle roundtrip. Consume the preprocess pool as it
+        # streams results, so Blender-side object building overlaps with the
+        # CPU-bound extraction in the workers. Images load lazily here since
+        # the full texture set isn't known up front.
+        print("Cache not found! Streaming import while it builds...")
+        gltf_files = list_gltf_files(GLTF_FOLDER)
+        cache_data = []
+        path_to_image = {}
+        done = 0
+        for item in iter_preprocessed(gltf_files):
+            if not item:
+                continue
+            cache_data.append(item)
+            for m_idx, mesh_info in enumerate(item['meshes']):
+                import_mesh(item['name'], f"{item['name']}_{m_idx}", mesh_info,
+                            materials_cache, path_to_image, collections_cache)
+                done += 1
+                if done % 500 == 0:
+                    print(f"Imported {done} meshes...")
+        # Persist what we just computed for the next (warm) run
+        save_cache(cache_data, cache_file)
+
+    # Every objects.link above only tagged the depsgraph; nothing in the loop
+    # forces an evaluation, so all N invalidations collapse into this single
+    # update instead of one per access on the next UI redraw.
+    bpy.context.view_layer.update()
 
     print(f"Finished in {time.time() - start:.2f}s")
 
 if __name__ == "__main__":
-    # Force rebuild cache if it doesn't exist
-    if not os.path.exists(CACHE_FILE):
-        build_cache(GLTF_FOLDER, CACHE_FILE)
-    else:
-        # Ask user (in console) or just run
-        # Ideally, delete the .pkl file manually if you changed texture folders
-        pass
-        
+    # Cold start streams preprocess -> import directly and saves the cache
+    # for next time; delete the cache file manually to force a rebuild
+    # (e.g. after changing texture folders)
     bulk_import(CACHE_FILE)